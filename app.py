@@ -9,12 +9,20 @@ URL: https://raw.githubusercontent.com/logpai/loghub/master/OpenSSH/OpenSSH_2k.l
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
+from plotly.colors import qualitative
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import hashlib
+import math
+import os
 import re
-from datetime import datetime
+import tempfile
+import time
+from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
+from typing import NamedTuple
 
 # =============================================================================
 # PAGE CONFIGURATION
@@ -29,7 +37,9 @@ st.set_page_config(
 # =============================================================================
 # CUSTOM STYLING - BUSINESS ANALYTICS THEME
 # =============================================================================
-st.markdown("""
+# Injected with st.html, which passes the stylesheet straight through
+# instead of running it through the markdown pipeline on every rerun
+CUSTOM_CSS = """
 <style>
     /* Dark business theme */
     .stApp {
@@ -120,7 +130,17 @@ st.markdown("""
         color: #8899a6;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+st.html(CUSTOM_CSS)
+
+# Static page header, built once at import and emitted with st.html like
+# the stylesheet (no markdown parse on each rerun)
+HEADER_HTML = """
+<div class="header-card">
+    <h1 class="header-title">🔐 OpenSSH Security Analytics Dashboard</h1>
+    <p class="header-subtitle">Real-time security monitoring and business intelligence for SSH access patterns</p>
+</div>
+"""
 
 # =============================================================================
 # CONSTANTS
@@ -141,9 +161,73 @@ COLORS = {
 # Event types that represent failed/attack attempts
 FAILED_EVENT_TYPES = ['Failed Password', 'Invalid User', 'Auth Failure']
 
+# Content keyword -> event type, checked in order (first match wins)
+EVENT_TYPE_KEYWORDS = (
+    ('break-in attempt', 'Break-in Attempt'),
+    ('failed password', 'Failed Password'),
+    ('invalid user', 'Invalid User'),
+    ('authentication failure', 'Auth Failure'),
+    ('accepted', 'Successful Login'),
+    ('session opened', 'Session Opened'),
+    ('session closed', 'Session Closed'),
+    ('disconnect', 'Disconnect'),
+    ('connection closed', 'Connection Closed')
+)
+
+# Severity level assigned to each event type (anything unmapped is 'Low')
+SEVERITY_MAP = {
+    'Break-in Attempt': 'Critical',
+    'Failed Password': 'High',
+    'Invalid User': 'High',
+    'Auth Failure': 'Medium',
+    'Disconnect': 'Low',
+    'Connection Closed': 'Low',
+    'Successful Login': 'Info',
+    'Session Opened': 'Info',
+    'Session Closed': 'Info',
+    'Other': 'Low'
+}
+
+# Raw CSV columns the dashboard reads (LineId, Pid and EventTemplate are unused)
+SOURCE_COLUMNS = ['Date', 'Day', 'Time', 'Component', 'Content', 'EventId']
+# Columns of the processed frame, in order (part of the disk-cache key, so a
+# schema change never serves a stale Parquet file)
+PROCESSED_COLUMNS = [
+    'Component', 'Content', 'EventId', 'DateTime', 'Hour', 'Minute',
+    'IP_Address', 'Event_Type', 'Username', 'Severity', 'Is_Failed_Auth'
+]
+
+# Keep Time as text: the pyarrow reader would otherwise infer time-of-day objects
+SOURCE_DTYPES = {'Time': 'str'}
+
+# Month abbreviations as they appear in the log's Date column
+MONTH_NUMBERS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+# Low-cardinality string columns stored as pandas categoricals so that
+# value_counts, isin and groupby operate on integer codes
+CATEGORICAL_COLUMNS = ['Event_Type', 'Severity', 'Component', 'EventId', 'IP_Address', 'Username']
+
+# Upper bound on timeline buckets per event type sent to the browser
+TIMELINE_MAX_POINTS = 1000
+
 # Cache TTL in seconds (5 minutes for timely security updates)
 CACHE_TTL_SECONDS = 300
 
+# Processed log frames are also persisted here (as Parquet, within the same
+# TTL) so a cold process skips the download and feature extraction
+DISK_CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Compiled once at import; the extractors run once per log line
+IP_PATTERN = re.compile(r'\b((?:\d{1,3}\.){3}\d{1,3})\b')
+USERNAME_PATTERNS = (
+    re.compile(r'for (?:invalid user )?(\w+) from'),
+    re.compile(r'user[= ](\w+)'),
+    re.compile(r'Invalid user (\w+)')
+)
+
 # =============================================================================
 # DATA LOADING
 # =============================================================================
@@ -155,143 +239,314 @@ def load_openssh_data():
     """
     url = "https://raw.githubusercontent.com/logpai/loghub/master/OpenSSH/OpenSSH_2k.log_structured.csv"
     
+    cache_path = disk_cache_path(url)
+    cached = read_disk_cache(cache_path)
+    if cached is not None:
+        return cached
+    
     try:
-        df = pd.read_csv(url)
+        df = pd.read_csv(url, engine='pyarrow', usecols=SOURCE_COLUMNS, dtype=SOURCE_DTYPES)
     except Exception as e:
         st.error(f"Failed to load data: {e}")
         return None
     
-    # Parse datetime
+    # Parse datetime from integer date components plus the HH:MM:SS offset,
+    # avoiding a per-row string concatenation and strptime
     df['DateTime'] = pd.to_datetime(
-        '2023-' + df['Date'] + '-' + df['Day'].astype(str) + ' ' + df['Time'],
-        format='%Y-%b-%d %H:%M:%S',
+        {'year': 2023, 'month': df['Date'].map(MONTH_NUMBERS), 'day': df['Day']},
         errors='coerce'
-    )
+    ) + pd.to_timedelta(df['Time'], errors='coerce')
+    df = df.drop(columns=['Date', 'Day', 'Time'])
     
-    # Extract hour for time-based analysis
+    # Extract hour and minute bucket for time-based analysis
     df['Hour'] = df['DateTime'].dt.hour
+    df['Minute'] = df['DateTime'].dt.floor('1min')
     
-    # Extract IP addresses
-    df['IP_Address'] = df['Content'].apply(extract_ip_address)
+    # Log lines repeat heavily, so extract IP, event type and username once
+    # per distinct line and join the results back onto every row
+    df = df.join(extract_line_features(pd.Series(df['Content'].dropna().unique())), on='Content')
+    df['Event_Type'] = df['Event_Type'].fillna('Other')
     
-    # Categorize events
-    df['Event_Type'] = df['Content'].apply(categorize_event)
+    # Assign severity levels (vectorized dict lookup instead of a per-row apply)
+    df['Severity'] = df['Event_Type'].map(SEVERITY_MAP).fillna('Low')
     
-    # Extract usernames
-    df['Username'] = df['Content'].apply(extract_username)
+    # Categorical dtypes for the columns every chart groups or counts on
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
     
-    # Assign severity levels
-    df['Severity'] = df['Event_Type'].apply(get_severity_level)
+    # Flag failed/attack attempts once, testing category codes rather than strings
+    failed_codes = df['Event_Type'].cat.categories.get_indexer(FAILED_EVENT_TYPES)
+    df['Is_Failed_Auth'] = np.isin(df['Event_Type'].cat.codes.to_numpy(), failed_codes[failed_codes >= 0])
+    
+    df = df[PROCESSED_COLUMNS]
+    write_disk_cache(df, cache_path)
     
     return df
 
 
-def extract_ip_address(content):
-    """Extract IP address from log content."""
-    pattern = r'\b(?:\d{1,3}\.){3}\d{1,3}\b'
-    match = re.search(pattern, str(content))
-    return match.group(0) if match else None
-
-
-def categorize_event(content):
-    """Categorize SSH events based on content."""
-    content_lower = str(content).lower()
-    
-    if 'break-in attempt' in content_lower:
-        return 'Break-in Attempt'
-    elif 'failed password' in content_lower:
-        return 'Failed Password'
-    elif 'invalid user' in content_lower:
-        return 'Invalid User'
-    elif 'authentication failure' in content_lower:
-        return 'Auth Failure'
-    elif 'accepted' in content_lower:
-        return 'Successful Login'
-    elif 'session opened' in content_lower:
-        return 'Session Opened'
-    elif 'session closed' in content_lower:
-        return 'Session Closed'
-    elif 'disconnect' in content_lower:
-        return 'Disconnect'
-    elif 'connection closed' in content_lower:
-        return 'Connection Closed'
-    else:
-        return 'Other'
-
-
-def extract_username(content):
-    """Extract username from log content."""
-    patterns = [
-        r'for (?:invalid user )?(\w+) from',
-        r'user[= ](\w+)',
-        r'Invalid user (\w+)'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, str(content))
-        if match:
-            return match.group(1)
-    return None
-
-
-def get_severity_level(event_type):
-    """Map event types to severity levels."""
-    severity_map = {
-        'Break-in Attempt': 'Critical',
-        'Failed Password': 'High',
-        'Invalid User': 'High',
-        'Auth Failure': 'Medium',
-        'Disconnect': 'Low',
-        'Connection Closed': 'Low',
-        'Successful Login': 'Info',
-        'Session Opened': 'Info',
-        'Session Closed': 'Info',
-        'Other': 'Low'
-    }
-    return severity_map.get(event_type, 'Low')
+def extract_line_features(lines):
+    """IP address, event type and username for each distinct log line."""
+    # Categorize events: lowercase once, then one substring scan per keyword
+    lines_lower = lines.str.lower()
+    event_type = np.select(
+        [lines_lower.str.contains(keyword, regex=False) for keyword, _ in EVENT_TYPE_KEYWORDS],
+        [event_type for _, event_type in EVENT_TYPE_KEYWORDS],
+        default='Other'
+    )
+    
+    # Usernames: first pattern that matches wins, later ones fill the gaps
+    username = lines.str.extract(USERNAME_PATTERNS[0], expand=False)
+    for pattern in USERNAME_PATTERNS[1:]:
+        username = username.fillna(lines.str.extract(pattern, expand=False))
+    
+    return pd.DataFrame({
+        'IP_Address': lines.str.extract(IP_PATTERN, expand=False),
+        'Event_Type': event_type,
+        'Username': username
+    }).set_axis(lines)
+
+
+def disk_cache_path(url):
+    """Parquet file holding the processed frame for a source URL and schema."""
+    key = repr((url, SOURCE_COLUMNS, PROCESSED_COLUMNS, CATEGORICAL_COLUMNS))
+    digest = hashlib.sha1(key.encode()).hexdigest()[:12]
+    return DISK_CACHE_DIR / f'openssh_{digest}.parquet'
+
+
+def read_disk_cache(cache_path):
+    """Cached frame if the file is fresh and readable, else None."""
+    try:
+        if time.time() - cache_path.stat().st_mtime >= CACHE_TTL_SECONDS:
+            return None
+        return pd.read_parquet(cache_path)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Truncated or corrupt file: drop it so the CSV path rebuilds it
+        try:
+            cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+        return None
+
+
+def write_disk_cache(df, cache_path):
+    """Atomically persist the processed frame (best effort; skipped if read-only)."""
+    try:
+        DISK_CACHE_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=DISK_CACHE_DIR, suffix='.tmp')
+    except OSError:
+        return
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        pass
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def df_fingerprint(df):
+    """Cheap cache key for a log DataFrame (avoids hashing every row)."""
+    return (len(df), str(df['DateTime'].min()), str(df['DateTime'].max()))
+
+
+# =============================================================================
+# AGGREGATES
+# =============================================================================
+class KpiCounts(NamedTuple):
+    """Headline counts shown in the KPI row."""
+    total_events: int
+    unique_ips: int
+    failed_attempts: int
+    critical_events: int
+    success_count: int
+
+
+class AttackSummary(NamedTuple):
+    """Figures shown in the Attack Patterns summary box."""
+    unique_ips: int
+    unique_users: int
+    top_user: str
+
+
+@dataclass(frozen=True)
+class AggBundle:
+    """
+    Aggregates shared by the sidebar, the KPI row and the charts.
+    Built once per dataset so page renders never re-scan the log DataFrame.
+    """
+    fingerprint: tuple
+    kpis: KpiCounts
+    attack_summary: AttackSummary
+    n_high: int
+    n_event_types: int
+    t_min: pd.Timestamp
+    t_max: pd.Timestamp
+    event_counts: pd.Series
+    severity_counts: pd.Series
+    # Rankings are sorted by count, so every top-N chart is a head() slice
+    ip_ranking: pd.Series
+    user_ranking: pd.Series
+    template_counts: pd.Series
+    component_counts: pd.Series
+    top_ip_events: pd.DataFrame
+    attack_stats: pd.DataFrame
+    hour_event_pivot: pd.DataFrame
+    timeline_agg: pd.DataFrame
+
+
+# hash_funcs for cached helpers that take the log DataFrame or the bundle
+CACHE_HASH_FUNCS = {
+    pd.DataFrame: df_fingerprint,
+    AggBundle: attrgetter('fingerprint')
+}
+
+
+def timeline_bucket(df):
+    """
+    Choose the timeline bucket width: one minute while every event type's
+    series has at most TIMELINE_MAX_POINTS occupied minutes, otherwise widened
+    just enough that the whole span fits in that many buckets. Counts are
+    summed into wider buckets rather than point-sampled, so the stacked areas
+    stay exact.
+    """
+    occupied = df.groupby('Event_Type', observed=True)['Minute'].nunique().max()
+    if pd.isna(occupied) or occupied <= TIMELINE_MAX_POINTS:
+        return '1min'
+    span = df['DateTime'].max() - df['DateTime'].min()
+    minutes = math.ceil(span / pd.Timedelta(minutes=1) / TIMELINE_MAX_POINTS)
+    return f"{max(1, minutes)}min"
+
+
+def hour_event_matrix(df):
+    """
+    Count events per hour and event type with a single np.bincount over
+    flattened (hour, category code) indices instead of a hash groupby.
+    Only hours and event types that occur are kept, as with groupby().unstack().
+    """
+    codes = df['Event_Type'].cat.codes.to_numpy()
+    valid = df['Hour'].notna().to_numpy() & (codes >= 0)
+    hours = df['Hour'].to_numpy()[valid].astype(np.intp)
+    event_types = df['Event_Type'].cat.categories
+    n_events = len(event_types)
+    
+    counts = np.bincount(
+        hours * n_events + codes[valid],
+        minlength=24 * n_events
+    ).reshape(24, n_events)
+    
+    matrix = pd.DataFrame(
+        counts,
+        index=pd.Index(range(24), name='Hour'),
+        columns=pd.CategoricalIndex(event_types, name='Event_Type')
+    )
+    return matrix.loc[matrix.any(axis=1), matrix.any(axis=0)]
+
+
+@st.cache_data(hash_funcs=CACHE_HASH_FUNCS)
+def build_agg_bundle(df):
+    """Compute every aggregate the dashboard pages need in one place."""
+    event_counts = df['Event_Type'].value_counts()
+    severity_counts = df['Severity'].value_counts()
+    ip_ranking = df['IP_Address'].value_counts()
+    
+    # All KPI counts are read off the value_counts tables above rather
+    # than from separate mask-and-filter scans of the frame
+    kpis = KpiCounts(
+        total_events=len(df),
+        unique_ips=len(ip_ranking),
+        failed_attempts=int(event_counts.reindex(FAILED_EVENT_TYPES, fill_value=0).sum()),
+        critical_events=int(severity_counts.get('Critical', 0)),
+        success_count=int(event_counts.get('Successful Login', 0))
+    )
+    
+    failed_events = df[df['Is_Failed_Auth']]
+    attack_groups = failed_events.groupby('IP_Address', observed=True)
+    attack_counts = attack_groups.size()
+    attack_stats = pd.DataFrame({
+        'Total_Attacks': attack_counts,
+        'Unique_Usernames': attack_groups['Username'].nunique()
+    }).nlargest(20, 'Total_Attacks').reset_index()
+    
+    attacked_users = failed_events['Username'].dropna()
+    attack_summary = AttackSummary(
+        unique_ips=len(attack_counts),
+        unique_users=attacked_users.nunique(),
+        top_user=attacked_users.mode().values[0] if len(attacked_users) > 0 else 'N/A'
+    )
+    
+    # IP x event breakdown for the sunburst, grouped over the top 8 IPs only
+    top_ip_rows = df[df['IP_Address'].isin(ip_ranking.head(8).index)]
+    top_ip_events = top_ip_rows.groupby(['IP_Address', 'Event_Type'], observed=True, sort=False).size().reset_index(name='Count')
+    
+    # Minute buckets are precomputed at load; only re-floor for long logs
+    bucket = timeline_bucket(df)
+    time_buckets = df['Minute'] if bucket == '1min' else df['Minute'].dt.floor(bucket)
+    
+    return AggBundle(
+        fingerprint=df_fingerprint(df),
+        kpis=kpis,
+        attack_summary=attack_summary,
+        n_high=int(severity_counts.get('High', 0)),
+        n_event_types=int((event_counts > 0).sum()),
+        t_min=df['DateTime'].min(),
+        t_max=df['DateTime'].max(),
+        event_counts=event_counts,
+        severity_counts=severity_counts,
+        ip_ranking=ip_ranking,
+        user_ranking=df['Username'].dropna().value_counts(),
+        template_counts=df['EventId'].value_counts().loc[lambda c: c > 0],
+        component_counts=df['Component'].value_counts().loc[lambda c: c > 0],
+        top_ip_events=top_ip_events,
+        attack_stats=attack_stats,
+        hour_event_pivot=hour_event_matrix(df),
+        timeline_agg=df.groupby([time_buckets.rename('DateTime'), 'Event_Type'], observed=True).size().reset_index(name='Count')
+    )
 
 
 # =============================================================================
 # VISUALIZATION FUNCTIONS
 # =============================================================================
-def create_kpi_metrics(df):
+def create_kpi_metrics(bundle):
     """Display key performance indicators."""
     col1, col2, col3, col4, col5 = st.columns(5)
     
-    total_events = len(df)
-    unique_ips = df['IP_Address'].nunique()
-    failed_attempts = len(df[df['Event_Type'].isin(FAILED_EVENT_TYPES)])
-    critical_events = len(df[df['Severity'] == 'Critical'])
-    success_count = len(df[df['Event_Type'] == 'Successful Login'])
+    kpis = bundle.kpis
     
     with col1:
-        st.metric("📊 Total Events", f"{total_events:,}")
+        st.metric("📊 Total Events", f"{kpis.total_events:,}")
     
     with col2:
-        st.metric("🌐 Unique IPs", f"{unique_ips}")
+        st.metric("🌐 Unique IPs", f"{kpis.unique_ips}")
     
     with col3:
-        st.metric("⚠️ Failed Attempts", f"{failed_attempts:,}")
+        st.metric("⚠️ Failed Attempts", f"{kpis.failed_attempts:,}")
     
     with col4:
-        st.metric("🚨 Critical Events", f"{critical_events}")
+        st.metric("🚨 Critical Events", f"{kpis.critical_events}")
     
     with col5:
-        st.metric("✅ Successful Logins", f"{success_count}")
+        st.metric("✅ Successful Logins", f"{kpis.success_count}")
 
 
-def create_event_distribution_chart(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_event_distribution_chart(bundle):
     """Create donut chart for event type distribution."""
-    event_counts = df['Event_Type'].value_counts().reset_index()
-    event_counts.columns = ['Event_Type', 'Count']
-    
-    fig = px.pie(
-        event_counts,
-        values='Count',
-        names='Event_Type',
-        hole=0.5,
-        color_discrete_sequence=px.colors.qualitative.Set3
-    )
+    event_counts = bundle.event_counts
+    
+    palette = qualitative.Set3
+    
+    fig = go.Figure(data=[
+        go.Pie(
+            labels=event_counts.index.astype(str),
+            values=event_counts.values,
+            hole=0.5,
+            marker=dict(colors=[palette[i % len(palette)] for i in range(len(event_counts))])
+        )
+    ])
     
     fig.update_layout(
         paper_bgcolor='rgba(0,0,0,0)',
@@ -318,10 +573,11 @@ def create_event_distribution_chart(df):
     return fig
 
 
-def create_severity_bar_chart(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_severity_bar_chart(bundle):
     """Create horizontal bar chart for severity distribution."""
     severity_order = ['Critical', 'High', 'Medium', 'Low', 'Info']
-    severity_counts = df['Severity'].value_counts().reindex(severity_order, fill_value=0)
+    severity_counts = bundle.severity_counts.reindex(severity_order, fill_value=0)
     
     colors = {
         'Critical': COLORS['danger'],
@@ -363,17 +619,27 @@ def create_severity_bar_chart(df):
     return fig
 
 
-def create_timeline_chart(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_timeline_chart(bundle):
     """Create area chart showing events over time."""
-    timeline = df.groupby([df['DateTime'].dt.floor('1min'), 'Event_Type']).size().reset_index(name='Count')
-    
-    fig = px.area(
-        timeline,
-        x='DateTime',
-        y='Count',
-        color='Event_Type',
-        color_discrete_sequence=px.colors.qualitative.Set2
-    )
+    timeline = bundle.timeline_agg
+    palette = qualitative.Set2
+    
+    # One stacked area trace per event type
+    traces = []
+    for i, event_type in enumerate(timeline['Event_Type'].unique()):
+        series = timeline[timeline['Event_Type'] == event_type]
+        traces.append(go.Scatter(
+            x=series['DateTime'],
+            y=series['Count'],
+            name=event_type,
+            mode='lines',
+            stackgroup='events',
+            line=dict(color=palette[i % len(palette)]),
+            hovertemplate=f'<b>{event_type}</b><br>%{{x}}<br>Count: %{{y}}<extra></extra>'
+        ))
+    
+    fig = go.Figure(data=traces)
     
     fig.update_layout(
         paper_bgcolor='rgba(0,0,0,0)',
@@ -403,9 +669,10 @@ def create_timeline_chart(df):
     return fig
 
 
-def create_hourly_heatmap(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_hourly_heatmap(bundle):
     """Create heatmap of events by hour and event type."""
-    heatmap_data = df.groupby(['Hour', 'Event_Type']).size().unstack(fill_value=0)
+    heatmap_data = bundle.hour_event_pivot
     
     fig = go.Figure(data=go.Heatmap(
         z=heatmap_data.values,
@@ -429,23 +696,23 @@ def create_hourly_heatmap(df):
     return fig
 
 
-def create_top_ips_chart(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_top_ips_chart(bundle):
     """Create bar chart of top IP addresses by event count."""
-    ip_counts = df['IP_Address'].value_counts().head(10).reset_index()
-    ip_counts.columns = ['IP_Address', 'Count']
+    ip_counts = bundle.ip_ranking.head(10)
     
     fig = go.Figure(data=[
         go.Bar(
-            x=ip_counts['Count'],
-            y=ip_counts['IP_Address'],
+            x=ip_counts.values,
+            y=ip_counts.index.astype(str),
             orientation='h',
             marker=dict(
-                color=ip_counts['Count'],
+                color=ip_counts.values,
                 colorscale='Reds',
                 showscale=True,
                 colorbar=dict(title='Count')
             ),
-            text=ip_counts['Count'],
+            text=ip_counts.values,
             textposition='auto',
             hovertemplate='<b>%{y}</b><br>Events: %{x}<extra></extra>'
         )
@@ -470,19 +737,37 @@ def create_top_ips_chart(df):
     return fig
 
 
-def create_ip_sunburst(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_ip_sunburst(bundle):
     """Create sunburst chart for IP and event type breakdown."""
-    ip_events = df.groupby(['IP_Address', 'Event_Type']).size().reset_index(name='Count')
-    top_ips = df['IP_Address'].value_counts().head(8).index.tolist()
-    ip_events_filtered = ip_events[ip_events['IP_Address'].isin(top_ips)]
-    
-    fig = px.sunburst(
-        ip_events_filtered,
-        path=['IP_Address', 'Event_Type'],
-        values='Count',
-        color='Count',
-        color_continuous_scale='RdYlGn_r'
-    )
+    ip_events_filtered = bundle.top_ip_events
+    
+    # Inner ring: one node per IP; outer ring: its event types.  IP nodes are
+    # coloured by the count-weighted mean of their children, as px.sunburst does.
+    ip_totals = ip_events_filtered.groupby('IP_Address', observed=True, sort=False)['Count'].sum()
+    ip_colors = (ip_events_filtered['Count'] ** 2).groupby(
+        ip_events_filtered['IP_Address'], observed=True, sort=False
+    ).sum() / ip_totals
+    leaf_parents = ip_events_filtered['IP_Address'].astype(str).tolist()
+    leaf_labels = ip_events_filtered['Event_Type'].astype(str).tolist()
+    root_labels = ip_totals.index.astype(str).tolist()
+    
+    fig = go.Figure(data=[
+        go.Sunburst(
+            ids=[f"{ip}/{et}" for ip, et in zip(leaf_parents, leaf_labels)] + root_labels,
+            labels=leaf_labels + root_labels,
+            parents=leaf_parents + [''] * len(root_labels),
+            values=ip_events_filtered['Count'].tolist() + ip_totals.tolist(),
+            branchvalues='total',
+            marker=dict(
+                colors=ip_events_filtered['Count'].tolist() + ip_colors.tolist(),
+                colorscale='RdYlGn_r',
+                showscale=True,
+                colorbar=dict(title='Count')
+            ),
+            hovertemplate='<b>%{label}</b><br>Count: %{value}<extra></extra>'
+        )
+    ])
     
     fig.update_layout(
         paper_bgcolor='rgba(0,0,0,0)',
@@ -495,18 +780,24 @@ def create_ip_sunburst(df):
     return fig
 
 
-def create_username_chart(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_username_chart(bundle):
     """Create bar chart of most targeted usernames."""
-    username_counts = df['Username'].dropna().value_counts().head(15).reset_index()
-    username_counts.columns = ['Username', 'Count']
-    
-    fig = px.bar(
-        username_counts,
-        x='Username',
-        y='Count',
-        color='Count',
-        color_continuous_scale='Viridis'
-    )
+    username_counts = bundle.user_ranking.head(15)
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=username_counts.index,
+            y=username_counts.values,
+            marker=dict(
+                color=username_counts.values,
+                colorscale='Viridis',
+                showscale=True,
+                colorbar=dict(title='Count')
+            ),
+            hovertemplate='<b>%{x}</b><br>Count: %{y}<extra></extra>'
+        )
+    ])
     
     fig.update_layout(
         paper_bgcolor='rgba(0,0,0,0)',
@@ -528,18 +819,26 @@ def create_username_chart(df):
     return fig
 
 
-def create_username_treemap(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_username_treemap(bundle):
     """Create treemap of username attack distribution."""
-    username_counts = df['Username'].dropna().value_counts().head(20).reset_index()
-    username_counts.columns = ['Username', 'Count']
-    
-    fig = px.treemap(
-        username_counts,
-        path=['Username'],
-        values='Count',
-        color='Count',
-        color_continuous_scale='Reds'
-    )
+    username_counts = bundle.user_ranking.head(20)
+    
+    fig = go.Figure(data=[
+        go.Treemap(
+            labels=username_counts.index,
+            parents=[''] * len(username_counts),
+            values=username_counts.values,
+            branchvalues='total',
+            marker=dict(
+                colors=username_counts.values,
+                colorscale='Reds',
+                showscale=True,
+                colorbar=dict(title='Count')
+            ),
+            hovertemplate='<b>%{label}</b><br>Count: %{value}<extra></extra>'
+        )
+    ])
     
     fig.update_layout(
         paper_bgcolor='rgba(0,0,0,0)',
@@ -552,6 +851,7 @@ def create_username_treemap(df):
     return fig
 
 
+@st.cache_resource
 def create_security_gauge(value, title, color):
     """Create a gauge chart for security metrics."""
     fig = go.Figure(go.Indicator(
@@ -581,27 +881,31 @@ def create_security_gauge(value, title, color):
     return fig
 
 
-def create_attack_scatter(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_attack_scatter(bundle):
     """Create scatter plot of attack patterns."""
-    failed_events = df[df['Event_Type'].isin(FAILED_EVENT_TYPES)]
-    
-    attack_stats = failed_events.groupby('IP_Address').agg({
-        'LineId': 'count',
-        'Username': lambda x: x.nunique()
-    }).reset_index()
-    attack_stats.columns = ['IP_Address', 'Total_Attacks', 'Unique_Usernames']
-    attack_stats = attack_stats.nlargest(20, 'Total_Attacks')
-    
-    fig = px.scatter(
-        attack_stats,
-        x='Total_Attacks',
-        y='Unique_Usernames',
-        size='Total_Attacks',
-        color='Total_Attacks',
-        hover_name='IP_Address',
-        color_continuous_scale='Reds',
-        size_max=40
-    )
+    attack_stats = bundle.attack_stats
+    # Area-scaled bubbles with the largest at 40px, matching px.scatter(size_max=40)
+    max_attacks = np.max(attack_stats['Total_Attacks'].to_numpy(), initial=1)
+    
+    fig = go.Figure(data=[
+        go.Scatter(
+            x=attack_stats['Total_Attacks'],
+            y=attack_stats['Unique_Usernames'],
+            mode='markers',
+            hovertext=attack_stats['IP_Address'],
+            marker=dict(
+                size=attack_stats['Total_Attacks'],
+                sizemode='area',
+                sizeref=2.0 * max_attacks / 40 ** 2,
+                color=attack_stats['Total_Attacks'],
+                colorscale='Reds',
+                showscale=True,
+                colorbar=dict(title='Total_Attacks')
+            ),
+            hovertemplate='<b>%{hovertext}</b><br>Attacks: %{x}<br>Unique Usernames: %{y}<extra></extra>'
+        )
+    ])
     
     fig.update_layout(
         paper_bgcolor='rgba(0,0,0,0)',
@@ -622,22 +926,22 @@ def create_attack_scatter(df):
     return fig
 
 
-def create_event_template_chart(df):
+@st.cache_resource(hash_funcs=CACHE_HASH_FUNCS)
+def create_event_template_chart(bundle):
     """Create bar chart for event templates."""
-    template_counts = df['EventId'].value_counts().head(12).reset_index()
-    template_counts.columns = ['EventId', 'Count']
+    template_counts = bundle.template_counts.head(12)
     
     fig = go.Figure(data=[
         go.Bar(
-            x=template_counts['Count'],
-            y=template_counts['EventId'],
+            x=template_counts.values,
+            y=template_counts.index.astype(str),
             orientation='h',
             marker=dict(
-                color=template_counts['Count'],
+                color=template_counts.values,
                 colorscale='Blues',
                 showscale=True
             ),
-            text=template_counts['Count'],
+            text=template_counts.values,
             textposition='auto'
         )
     ])
@@ -664,44 +968,36 @@ def create_event_template_chart(df):
 # =============================================================================
 # SIDEBAR
 # =============================================================================
-def render_sidebar(df):
+def render_sidebar(bundle):
     """Render the sidebar with navigation and data info."""
     st.sidebar.markdown("## 🔐 SSH Analytics")
-    st.sidebar.markdown("---")
+    st.sidebar.divider()
     
     # Data overview
     st.sidebar.markdown("### 📊 Data Overview")
     st.sidebar.markdown(f"""
-    - **Records:** {len(df):,}
-    - **Unique IPs:** {df['IP_Address'].nunique()}
-    - **Event Types:** {df['Event_Type'].nunique()}
-    - **Time Range:** {df['DateTime'].min().strftime('%H:%M') if pd.notna(df['DateTime'].min()) else 'N/A'} to {df['DateTime'].max().strftime('%H:%M') if pd.notna(df['DateTime'].max()) else 'N/A'}
+    - **Records:** {bundle.kpis.total_events:,}
+    - **Unique IPs:** {bundle.kpis.unique_ips}
+    - **Event Types:** {bundle.n_event_types}
+    - **Time Range:** {bundle.t_min.strftime('%H:%M') if pd.notna(bundle.t_min) else 'N/A'} to {bundle.t_max.strftime('%H:%M') if pd.notna(bundle.t_max) else 'N/A'}
     """)
     
-    st.sidebar.markdown("---")
+    st.sidebar.divider()
     
     # Page navigation
     st.sidebar.markdown("### 🧭 Navigation")
     page = st.sidebar.radio(
         "Select View",
-        [
-            "📊 Executive Summary",
-            "📈 Time Analysis",
-            "🌐 IP Analysis",
-            "👤 User Analysis",
-            "⚔️ Attack Patterns",
-            "📋 Event Templates",
-            "🔍 Log Explorer"
-        ],
+        list(PAGES),
         label_visibility="collapsed"
     )
     
-    st.sidebar.markdown("---")
+    st.sidebar.divider()
     
     # Alert summary
     st.sidebar.markdown("### ⚡ Alert Summary")
-    critical = len(df[df['Severity'] == 'Critical'])
-    high = len(df[df['Severity'] == 'High'])
+    critical = bundle.kpis.critical_events
+    high = bundle.n_high
     
     if critical > 0:
         st.sidebar.error(f"🚨 {critical} Critical Events")
@@ -710,7 +1006,7 @@ def render_sidebar(df):
     if critical == 0 and high == 0:
         st.sidebar.success("✅ No Critical/High Events")
     
-    st.sidebar.markdown("---")
+    st.sidebar.divider()
     
     # Data source info
     st.sidebar.markdown("### ℹ️ Data Source")
@@ -723,20 +1019,21 @@ def render_sidebar(df):
 # =============================================================================
 # PAGE RENDERERS
 # =============================================================================
-def render_executive_summary(df):
+def render_executive_summary(df, bundle):
     """Render the executive summary page."""
     # KPI Metrics
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     # Security gauges
     st.markdown("### 🛡️ Security Metrics")
     
-    total = len(df)
-    critical = len(df[df['Severity'] == 'Critical'])
-    high = len(df[df['Severity'] == 'High'])
-    failed = len(df[df['Event_Type'].isin(FAILED_EVENT_TYPES)])
+    kpis = bundle.kpis
+    total = kpis.total_events
+    critical = kpis.critical_events
+    high = bundle.n_high
+    failed = kpis.failed_attempts
     
     threat_score = min(100, (critical * 10 + high * 2) / total * 100) if total > 0 else 0
     attack_intensity = (failed / total * 100) if total > 0 else 0
@@ -752,12 +1049,11 @@ def render_executive_summary(df):
         st.plotly_chart(fig, use_container_width=True)
     
     with col3:
-        unique_ips = df['IP_Address'].nunique()
-        ip_score = min(100, unique_ips * 2)
+        ip_score = min(100, kpis.unique_ips * 2)
         fig = create_security_gauge(ip_score, "Unique Attackers", COLORS['warning'])
         st.plotly_chart(fig, use_container_width=True)
     
-    st.markdown("---")
+    st.divider()
     
     # Distribution charts
     st.markdown("### 📊 Event Distribution")
@@ -766,39 +1062,39 @@ def render_executive_summary(df):
     
     with col1:
         st.markdown("#### Event Types")
-        fig = create_event_distribution_chart(df)
+        fig = create_event_distribution_chart(bundle)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### Severity Levels")
-        fig = create_severity_bar_chart(df)
+        fig = create_severity_bar_chart(bundle)
         st.plotly_chart(fig, use_container_width=True)
 
 
-def render_time_analysis(df):
+def render_time_analysis(df, bundle):
     """Render the time analysis page."""
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     # Timeline
     st.markdown("### 📈 Event Timeline")
-    fig = create_timeline_chart(df)
+    fig = create_timeline_chart(bundle)
     st.plotly_chart(fig, use_container_width=True)
     
-    st.markdown("---")
+    st.divider()
     
     # Hourly heatmap
     st.markdown("### 🕐 Hourly Activity Heatmap")
-    fig = create_hourly_heatmap(df)
+    fig = create_hourly_heatmap(bundle)
     st.plotly_chart(fig, use_container_width=True)
 
 
-def render_ip_analysis(df):
+def render_ip_analysis(df, bundle):
     """Render the IP analysis page."""
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     st.markdown("### 🌐 IP Address Analysis")
     
@@ -806,20 +1102,20 @@ def render_ip_analysis(df):
     
     with col1:
         st.markdown("#### Top IP Addresses")
-        fig = create_top_ips_chart(df)
+        fig = create_top_ips_chart(bundle)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### IP Event Breakdown")
-        fig = create_ip_sunburst(df)
+        fig = create_ip_sunburst(bundle)
         st.plotly_chart(fig, use_container_width=True)
 
 
-def render_user_analysis(df):
+def render_user_analysis(df, bundle):
     """Render the user analysis page."""
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     st.markdown("### 👤 Username Attack Analysis")
     
@@ -827,20 +1123,20 @@ def render_user_analysis(df):
     
     with col1:
         st.markdown("#### Most Targeted Usernames")
-        fig = create_username_chart(df)
+        fig = create_username_chart(bundle)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### Username Distribution")
-        fig = create_username_treemap(df)
+        fig = create_username_treemap(bundle)
         st.plotly_chart(fig, use_container_width=True)
 
 
-def render_attack_patterns(df):
+def render_attack_patterns(df, bundle):
     """Render the attack patterns page."""
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     st.markdown("### ⚔️ Attack Pattern Analysis")
     
@@ -848,33 +1144,33 @@ def render_attack_patterns(df):
     
     with col1:
         st.markdown("#### Attack Behavior by IP")
-        fig = create_attack_scatter(df)
+        fig = create_attack_scatter(bundle)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Attack statistics
         st.markdown("#### Attack Statistics")
         
-        failed_events = df[df['Event_Type'].isin(FAILED_EVENT_TYPES)]
+        summary = bundle.attack_summary
         
         st.markdown(f"""
         <div class="info-box">
             <h4 style="color: #00d9ff; margin-top: 0;">Attack Summary</h4>
             <ul style="color: #ffffff;">
-                <li><strong>Total Failed Attempts:</strong> {len(failed_events):,}</li>
-                <li><strong>Unique Attacking IPs:</strong> {failed_events['IP_Address'].nunique()}</li>
-                <li><strong>Unique Targeted Users:</strong> {failed_events['Username'].nunique()}</li>
-                <li><strong>Most Attacked User:</strong> {failed_events['Username'].mode().values[0] if len(failed_events['Username'].dropna()) > 0 else 'N/A'}</li>
+                <li><strong>Total Failed Attempts:</strong> {bundle.kpis.failed_attempts:,}</li>
+                <li><strong>Unique Attacking IPs:</strong> {summary.unique_ips}</li>
+                <li><strong>Unique Targeted Users:</strong> {summary.unique_users}</li>
+                <li><strong>Most Attacked User:</strong> {summary.top_user}</li>
             </ul>
         </div>
         """, unsafe_allow_html=True)
 
 
-def render_event_templates(df):
+def render_event_templates(df, bundle):
     """Render the event templates page."""
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     st.markdown("### 📋 Event Template Analysis")
     
@@ -882,78 +1178,94 @@ def render_event_templates(df):
     
     with col1:
         st.markdown("#### Top Event Templates")
-        fig = create_event_template_chart(df)
+        fig = create_event_template_chart(bundle)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         st.markdown("#### Template Statistics")
+        template_counts = bundle.template_counts
+        component_counts = bundle.component_counts
         st.markdown(f"""
         <div class="info-box">
             <ul style="color: #ffffff;">
-                <li><strong>Total Templates:</strong> {df['EventId'].nunique()}</li>
-                <li><strong>Most Common:</strong> {df['EventId'].mode().values[0] if len(df['EventId'].mode()) > 0 else 'N/A'}</li>
-                <li><strong>Components:</strong> {df['Component'].nunique()}</li>
+                <li><strong>Total Templates:</strong> {len(template_counts)}</li>
+                <li><strong>Most Common:</strong> {template_counts.index[0] if len(template_counts) > 0 else 'N/A'}</li>
+                <li><strong>Components:</strong> {len(component_counts)}</li>
             </ul>
         </div>
         """, unsafe_allow_html=True)
         
         st.markdown("#### Component Breakdown")
-        component_counts = df['Component'].value_counts()
         for comp, count in component_counts.items():
-            pct = count / len(df) * 100
+            pct = count / bundle.kpis.total_events * 100
             st.markdown(f"**{comp}:** {count:,} ({pct:.1f}%)")
 
 
-def render_log_explorer(df):
+def render_log_explorer(df, bundle):
     """Render the log explorer page."""
-    create_kpi_metrics(df)
+    create_kpi_metrics(bundle)
     
-    st.markdown("---")
+    st.divider()
     
     st.markdown("### 🔍 Log Explorer")
     
-    # Filters
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        event_filter = st.selectbox(
-            "Filter by Event Type",
-            ["All"] + list(df['Event_Type'].unique())
-        )
-    
-    with col2:
-        severity_filter = st.selectbox(
-            "Filter by Severity",
-            ["All"] + list(df['Severity'].unique())
-        )
-    
-    with col3:
-        ip_options = ["All"] + list(df['IP_Address'].dropna().unique()[:50])
-        ip_filter = st.selectbox("Filter by IP", ip_options)
+    # Filters (in a form, so changing several triggers one rerun on Apply)
+    with st.form("log_filters"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            event_filter = st.selectbox(
+                "Filter by Event Type",
+                ["All"] + list(df['Event_Type'].unique())
+            )
+        
+        with col2:
+            severity_filter = st.selectbox(
+                "Filter by Severity",
+                ["All"] + list(df['Severity'].unique())
+            )
+        
+        with col3:
+            ip_options = ["All"] + list(df['IP_Address'].dropna().unique()[:50])
+            ip_filter = st.selectbox("Filter by IP", ip_options)
+        
+        st.form_submit_button("Apply")
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as one combined mask (no intermediate frames)
+    mask = np.ones(len(df), dtype=bool)
     
     if event_filter != "All":
-        filtered_df = filtered_df[filtered_df['Event_Type'] == event_filter]
+        mask &= df['Event_Type'].values == event_filter
     
     if severity_filter != "All":
-        filtered_df = filtered_df[filtered_df['Severity'] == severity_filter]
+        mask &= df['Severity'].values == severity_filter
     
     if ip_filter != "All":
-        filtered_df = filtered_df[filtered_df['IP_Address'] == ip_filter]
+        mask &= df['IP_Address'].values == ip_filter
     
-    st.markdown(f"**Showing {len(filtered_df):,} of {len(df):,} records**")
+    st.markdown(f"**Showing {mask.sum():,} of {len(df):,} records**")
     
     # Display data
     display_cols = ['DateTime', 'Event_Type', 'Severity', 'IP_Address', 'Username', 'Content']
     st.dataframe(
-        filtered_df[display_cols].head(100),
+        df.loc[mask, display_cols].head(100),
         use_container_width=True,
         height=500
     )
 
 
+# Sidebar label -> page renderer, in navigation order
+PAGES = {
+    "📊 Executive Summary": render_executive_summary,
+    "📈 Time Analysis": render_time_analysis,
+    "🌐 IP Analysis": render_ip_analysis,
+    "👤 User Analysis": render_user_analysis,
+    "⚔️ Attack Patterns": render_attack_patterns,
+    "📋 Event Templates": render_event_templates,
+    "🔍 Log Explorer": render_log_explorer
+}
+
+
 # =============================================================================
 # MAIN APPLICATION
 # =============================================================================
@@ -969,31 +1281,16 @@ def main():
         return
     
     # Header
-    st.markdown("""
-    <div class="header-card">
-        <h1 class="header-title">🔐 OpenSSH Security Analytics Dashboard</h1>
-        <p class="header-subtitle">Real-time security monitoring and business intelligence for SSH access patterns</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.html(HEADER_HTML)
+    
+    # Aggregates shared by every page
+    bundle = build_agg_bundle(df)
     
     # Sidebar and navigation
-    page = render_sidebar(df)
+    page = render_sidebar(bundle)
     
     # Render selected page
-    if page == "📊 Executive Summary":
-        render_executive_summary(df)
-    elif page == "📈 Time Analysis":
-        render_time_analysis(df)
-    elif page == "🌐 IP Analysis":
-        render_ip_analysis(df)
-    elif page == "👤 User Analysis":
-        render_user_analysis(df)
-    elif page == "⚔️ Attack Patterns":
-        render_attack_patterns(df)
-    elif page == "📋 Event Templates":
-        render_event_templates(df)
-    elif page == "🔍 Log Explorer":
-        render_log_explorer(df)
+    PAGES[page](df, bundle)
 
 
 if __name__ == "__main__":